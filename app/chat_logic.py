@@ -1,16 +1,72 @@
 
-import json
+import functools
+import itertools
 import os
-from typing import List, Dict
+import re
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain.prompts import PromptTemplate
-from langchain.memory import ConversationBufferWindowMemory
-from langchain.chains import LLMChain
-from langchain.output_parsers import PydanticOutputParser
 from pydantic import BaseModel, Field
+from tenacity import Retrying, retry_if_exception_type, stop_after_attempt, wait_random_exponential
 
-from config.settings import GEMINI_API_KEY, GEMINI_MODEL_NAME, State
+from config.settings import (
+    GEMINI_API_KEY,
+    GEMINI_MODEL_NAME,
+    HISTORY_WINDOW_TURNS,
+    LLM_CACHE_PATH,
+    LLM_MAX_ATTEMPTS,
+    LLM_RETRY_MAX_WAIT_SECONDS,
+    LLM_RETRY_MIN_WAIT_SECONDS,
+    LLM_TIMEOUT_SECONDS,
+    MAX_CONCURRENT_LLM_REQUESTS,
+    PREFETCH_WORKERS,
+    State,
+)
+
+# LangChain and the Google client are imported lazily (see AssistantResources) to keep cold starts fast
+if TYPE_CHECKING:
+    from langchain_core.runnables import Runnable
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
+
+@functools.lru_cache(maxsize=None)
+def enable_llm_cache() -> None:
+    """Installs the persistent LLM response cache once per process.
+
+    Entries are keyed on model, parameters and full prompt. Swap in
+    langchain_community.cache.RedisCache for multi-worker deployments.
+    """
+    from langchain_community.cache import SQLiteCache
+    from langchain_core.globals import set_llm_cache
+
+    set_llm_cache(SQLiteCache(database_path=LLM_CACHE_PATH))
+
+
+def transient_llm_errors() -> tuple:
+    """Transient Gemini failures (rate limits, overload, timeouts) that are retried with backoff."""
+    from google.api_core.exceptions import DeadlineExceeded, ResourceExhausted, ServiceUnavailable
+
+    return (ResourceExhausted, ServiceUnavailable, DeadlineExceeded)
+
+
+def llm_retrying(transient_errors: tuple) -> Retrying:
+    """The single retry policy for Gemini calls: bounded attempts with jittered exponential backoff."""
+    return Retrying(
+        stop=stop_after_attempt(LLM_MAX_ATTEMPTS),
+        wait=wait_random_exponential(min=LLM_RETRY_MIN_WAIT_SECONDS, max=LLM_RETRY_MAX_WAIT_SECONDS),
+        retry=retry_if_exception_type(transient_errors),
+        reraise=True,
+    )
 
 
 # ==============================================================================
@@ -32,10 +88,9 @@ class TechQuestion(BaseModel):
     question: str = Field(description="A specific technical question related to the technology.")
 
 class TechAssessment(BaseModel):
-    """Schema for generating technical questions grouped by technology."""
-    assessment: Dict[str, List[TechQuestion]] = Field(
-        description="A dictionary where keys are the technologies (e.g., 'Python') and values are a list of 3-5 relevant TechQuestion objects."
-    )
+    """Schema for the technical questions generated for a single technology."""
+    technology: str = Field(description="The technology being assessed (e.g., 'Python').")
+    questions: List[TechQuestion] = Field(description="A list of 3-5 relevant TechQuestion objects.")
 
 
 # ==============================================================================
@@ -48,7 +103,7 @@ INFO_GATHERING_PROMPT = """
 
 --- INSTRUCTION ---
 1.  **Sequential Gathering**: Ask for **ONE** piece of information at a time. Start with the **Full Name**.
-2.  **Confirmation and Transition**: Once you believe you have collected the entire **Tech Stack**, you must conclude with this specific phrase: "Thank you for providing your details. We are now moving to the **Technical Assessment Stage**. Your tech stack is: [list tech stack]. Please type 'NEXT' to confirm this is correct and proceed, or update your tech stack now."
+2.  **Confirmation and Transition**: Once you believe you have collected the entire **Tech Stack**, you must conclude with this specific phrase: "Thank you for providing your details. We are now moving to the **Technical Assessment Stage**. Your tech stack is: [comma-separated list of technologies]. Please type 'NEXT' to confirm this is correct and proceed, or update your tech stack now."
 3.  **Exit Handling**: If the candidate types "quit," "bye," "exit," or "end," conclude the conversation gracefully.
 
 Conversation History: {history}
@@ -57,147 +112,349 @@ Candidate Input: {user_input}
 
 TECH_QUESTIONS_PROMPT_TEMPLATE = """
 **ROLE**: You are "TalentScout Tech Assessor," a highly skilled technical interviewer.
-**GOAL**: Generate 3 to 5 challenging, relevant, and concise technical screening questions for each technology listed in the provided Tech Stack.
+**GOAL**: Generate 3 to 5 challenging, relevant, and concise technical screening questions for the technology below.
 
 --- INPUT DATA ---
-Candidate's Tech Stack: {tech_stack}
+Technology: {technology}
 
 --- INSTRUCTION ---
-1.  **Constraint**: You MUST generate exactly **3 to 5 questions** for **EACH** technology item listed.
-2.  **Format**: You MUST output a single JSON object that strictly adheres to the provided output schema.
-
---- OUTPUT SCHEMA ---
-{format_instructions}
+1.  **Constraint**: You MUST generate exactly **3 to 5 questions**, all about this technology.
 """
 
 
 # ==============================================================================
-# 3. Core Assistant Class
+# 3. Tech Assessment Cache
 # ==============================================================================
 
-class TalentScoutAssistant:
+# Common spelling variants mapped to one canonical name so near-identical stacks share an entry
+TECH_ALIASES = {
+    "postgres": "postgresql",
+    "psql": "postgresql",
+    "js": "javascript",
+    "ts": "typescript",
+    "node": "node.js",
+    "nodejs": "node.js",
+    "react.js": "react",
+    "reactjs": "react",
+    "k8s": "kubernetes",
+    "golang": "go",
+    "mongo": "mongodb",
+    "py": "python",
+    "python3": "python",
+}
+
+# Pulls the confirmed stack out of the assistant's transition message (see INFO_GATHERING_PROMPT)
+TECH_STACK_RE = re.compile(r"your tech stack is:\s*(.+?)\.\s*(?:please|$)", re.IGNORECASE | re.DOTALL)
+TRANSITION_PHRASE_RE = re.compile(r"technical assessment stage", re.IGNORECASE)
+# The whole reply must be the confirmation token (optionally quoted / punctuated), not merely contain it
+NEXT_COMMAND_RE = re.compile(r"\s*['\"]?next['\"]?[.!]*\s*", re.IGNORECASE)
+# Local vocabulary for spotting technologies in candidate replies without an LLM call
+KNOWN_TECHNOLOGIES = (
+    "Python", "Java", "JavaScript", "TypeScript", "C++", "C#", "Go", "Golang", "Rust", "Kotlin",
+    "Swift", "Ruby", "PHP", "Scala", "Dart", "MATLAB", "SQL", "PostgreSQL", "MySQL", "SQLite",
+    "MongoDB", "Redis", "Cassandra", "Elasticsearch", "DynamoDB", "Snowflake", "BigQuery",
+    "Django", "Flask", "FastAPI", "Spring Boot", "Ruby on Rails", "Laravel", "Node.js", "React",
+    "Angular", "Vue.js", "Next.js", "Svelte", "jQuery", "HTML", "CSS", "Tailwind", "GraphQL",
+    "Docker", "Kubernetes", "Terraform", "Ansible", "Jenkins", "Git", "AWS", "Azure", "GCP",
+    "Linux", "Kafka", "RabbitMQ", "Spark", "Hadoop", "Airflow", "Pandas", "NumPy",
+    "scikit-learn", "TensorFlow", "PyTorch", "Keras", "LangChain", "Tableau", "Power BI",
+)
+# Names that are also ordinary words; matched only with their exact casing
+CASE_SENSITIVE_TECHNOLOGIES = {"Go"}
+# Names that are also everyday English; counted only when listed right next to another technology
+AMBIGUOUS_TECHNOLOGIES = {"Go", "React", "Spark", "Swift", "Rust", "Dart", "Ruby", "Pandas"}
+# What may separate two technologies in a list, e.g. "Go, Rust", "Go/Rust", "Go and Rust"
+TECH_LIST_GAP_RE = re.compile(r"\s*(?:[,/;&+]|\band\b|\bor\b)?\s*", re.IGNORECASE)
+_TECH_BY_NAME = {tech.lower(): tech for tech in KNOWN_TECHNOLOGIES}
+KNOWN_TECH_RE = re.compile(
+    r"(?<![\w.+#])("
+    + "|".join(
+        f"(?-i:{re.escape(t)})" if t in CASE_SENSITIVE_TECHNOLOGIES else re.escape(t)
+        for t in sorted(KNOWN_TECHNOLOGIES, key=len, reverse=True)
+    )
+    + r")(?![\w+#]|\.\w)",
+    re.IGNORECASE,
+)
+# Matches only once the stack sentence is complete, so it is safe to test against a partial stream
+STACK_SENTENCE_DONE_RE = re.compile(r"your tech stack is:.+?\.\s*please", re.IGNORECASE | re.DOTALL)
+
+# Process-level cache: canonical technology name -> generated questions
+_ASSESSMENT_CACHE: Dict[str, List[TechQuestion]] = {}
+
+
+def _listed_with_neighbour(text: str, matches: List[re.Match], i: int) -> bool:
+    """True when match ``i`` sits in a list next to another technology ("Go, Rust", "Spark and Kafka")."""
+    if i > 0 and TECH_LIST_GAP_RE.fullmatch(text, matches[i - 1].end(), matches[i].start()):
+        return True
+    if i + 1 < len(matches) and TECH_LIST_GAP_RE.fullmatch(text, matches[i].end(), matches[i + 1].start()):
+        return True
+    return False
+
+
+def canonical_tech(tech: str) -> str:
+    """Normalizes a technology name for case- and alias-insensitive lookups."""
+    name = tech.strip().lower()
+    return TECH_ALIASES.get(name, name)
+
+
+def tech_stack_key(tech_stack: List[str]) -> tuple:
+    """Builds an order- and case-insensitive key for a tech stack."""
+    return tuple(sorted({canonical_tech(t) for t in tech_stack if t.strip()}))
+
+
+# ==============================================================================
+# 4. Core Assistant Class
+# ==============================================================================
+
+class AssistantResources:
+    """Stateless, expensive LLM objects that can be shared by every chat session."""
+
     def __init__(self):
         if not os.getenv("GEMINI_API_KEY"):
              raise ValueError("GEMINI_API_KEY not set.")
+
+        # Heavy imports deferred to first use; st.cache_resource makes this once per process
+        from langchain_core.runnables import RunnableLambda
+        from langchain_google_genai import ChatGoogleGenerativeAI
+
+        enable_llm_cache()
+        self.retrying = llm_retrying(transient_llm_errors())
         
         # Initialize the LLM
-        self.llm = ChatGoogleGenerativeAI(
+        self.llm: "ChatGoogleGenerativeAI" = ChatGoogleGenerativeAI(
             model=GEMINI_MODEL_NAME, 
             google_api_key=os.getenv("GEMINI_API_KEY"),
-            temperature=0.2
-        )
-        
-        # Initialize Conversation Memory
-        self.memory = ConversationBufferWindowMemory(
-            memory_key="history",
-            input_key="user_input",
-            return_messages=True,
-            k=8
-        )
-        
-        # Information Gathering Chain (LLMChain)
-        self.info_chain = LLMChain(
-            llm=self.llm,
-            prompt=PromptTemplate.from_template(INFO_GATHERING_PROMPT),
-            memory=self.memory,
-            verbose=False
+            temperature=0.2,
+            timeout=LLM_TIMEOUT_SECONDS,
+            max_retries=1, # Retries are applied per call site below, with jittered backoff
         )
 
-        # Tech Assessment setup
-        self.assessment_parser = PydanticOutputParser(pydantic_object=TechAssessment)
-        self.tech_prompt = PromptTemplate(
-            template=TECH_QUESTIONS_PROMPT_TEMPLATE,
-            input_variables=["tech_stack"],
-            partial_variables={"format_instructions": self.assessment_parser.get_format_instructions()},
+        # Tech Assessment setup (Gemini native structured output, no format boilerplate in the prompt)
+        # Each call goes through the shared retry policy, so batch() retries only the failed prompts
+        structured = self.llm.with_structured_output(TechAssessment)
+        self.structured_llm: "Runnable" = RunnableLambda(
+            lambda messages: self.retrying.copy()(structured.invoke, messages)
         )
-        
-        self.current_question_index: int = 0
-        self.all_questions_list: List[str] = []
-        self.user_answers: Dict[str, str] = {}
+        # Static template with a single slot; str.format avoids PromptTemplate rendering per call
+        self.tech_prompt: str = TECH_QUESTIONS_PROMPT_TEMPLATE
 
+        # Background workers that prefetch questions while candidates are typing
+        self.executor = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS)
 
-    def _extract_tech_stack_from_history(self) -> List[str]:
-        """Uses a targeted LLM call to extract the final tech stack."""
-        extraction_prompt = f"""
-        Analyze the following conversation history and extract ONLY the list of key technologies, 
-        frameworks, languages, databases, and tools the candidate declared they are proficient in. 
-        Return the result as a comma-separated list of technologies.
+
+class TalentScoutAssistant:
+    def __init__(self, resources: AssistantResources):
+        # Shared LLM handles (built once per process by the caller); only the state below is per session
+        self.llm = resources.llm
+        self.structured_llm = resources.structured_llm
+        self._retrying = resources.retrying
+        self.tech_prompt = resources.tech_prompt
+        self._executor = resources.executor
         
-        Conversation History: {str(self.memory.load_memory_variables({})['history'])}
-        """
-        try:
-            response = self.llm.invoke(extraction_prompt).content
-            return [t.strip() for t in response.split(',') if t.strip()]
-        except Exception:
-            return ["Python", "SQL"] # Fallback
+        # Conversation window of (role, text) pairs; two entries per exchange
+        self.history: Deque[Tuple[str, str]] = deque(maxlen=2 * HISTORY_WINDOW_TURNS)
+        
+        # Pre-numbered (number, question) pairs, consumed through a single iterator
+        self._questions: Tuple[Tuple[int, str], ...] = ()
+        self._q_iter: Iterator[Tuple[int, str]] = iter(())
+        self.user_answers: List[str] = []
+
+        # Single working memory of confirmed candidate details (CandidateInfo field names as keys);
+        # rendered into the info-gathering prompt ahead of the history window
+        self.candidate_info: Dict[str, object] = {}
+        # Known technologies spotted locally in candidate replies, in order of first mention
+        self._tech_mentions: List[str] = []
+
+        # Set when the latest assistant reply contained the transition phrase
+        self._transition_armed: bool = False
+
+        # Pending prefetches for this session, keyed on the normalized tech stack
+        self._prefetched: Dict[tuple, Future] = {}
+
+
+    def _format_history(self) -> str:
+        """Renders confirmed candidate details plus the conversation window as plain lines for the prompt."""
+        lines = [
+            f"Confirmed {field}: {', '.join(value) if isinstance(value, list) else value}"
+            for field, value in self.candidate_info.items()
+        ]
+        lines.extend(f"{role}: {text}" for role, text in self.history)
+        return "\n".join(lines)
+
+    def _open_stream(self, prompt: str) -> Iterator:
+        """Opens the reply stream, retrying transient errors until the first chunk arrives."""
+        for attempt in self._retrying.copy():
+            with attempt:
+                stream = self.llm.stream(prompt)
+                first = next(stream, None)
+        return itertools.chain([first] if first is not None else [], stream)
+
+    def _stream_info_response(self, user_input: str) -> Iterator[str]:
+        """Streams the information-gathering reply and records the exchange in history."""
+        prompt = INFO_GATHERING_PROMPT.format(history=self._format_history(), user_input=user_input)
+        self._note_tech_mentions(user_input)
+        response = ""
+        stack_seen = False
+        for chunk in self._open_stream(prompt):
+            response += chunk.content
+
+            # Speculatively start question generation as soon as the stack sentence is complete,
+            # while the rest of the reply is still streaming and before the candidate types NEXT
+            if not stack_seen and STACK_SENTENCE_DONE_RE.search(response):
+                stack_seen = True
+                self._record_tech_stack(response)
+            yield chunk.content
+
+        # NEXT is honoured only directly after a reply containing the transition phrase
+        self._transition_armed = bool(TRANSITION_PHRASE_RE.search(response))
+
+        # Save the turn only once the stream has completed
+        self.history.append(("Candidate", user_input))
+        self.history.append(("Assistant", response))
+
+        if not stack_seen and self._transition_armed:
+            self._record_tech_stack(response)
+
+    def _record_tech_stack(self, transition_message: str) -> None:
+        """Stores the stated tech stack and prefetches its questions in the background."""
+        self._remember("tech_stack", self._parse_tech_stack(transition_message))
+        self._prefetch_assessment(self.candidate_info["tech_stack"])
+
+    def _remember(self, field: str, value: object) -> None:
+        """Stores a confirmed candidate detail in working memory under its CandidateInfo field name."""
+        if field not in CandidateInfo.model_fields:
+            raise KeyError(f"Unknown CandidateInfo field: {field}")
+        self.candidate_info[field] = value
+
+    def _note_tech_mentions(self, candidate_reply: str) -> None:
+        """Accumulates known technologies the candidate mentions, for use as a local fallback."""
+        matches = list(KNOWN_TECH_RE.finditer(candidate_reply))
+        for i, match in enumerate(matches):
+            tech = _TECH_BY_NAME[match.group(1).lower()]
+            if tech in AMBIGUOUS_TECHNOLOGIES and not _listed_with_neighbour(candidate_reply, matches, i):
+                continue
+            if tech not in self._tech_mentions:
+                self._tech_mentions.append(tech)
+
+    def _parse_tech_stack(self, transition_message: str) -> List[str]:
+        """Reads the tech stack the assistant listed in its transition message (no LLM call)."""
+        # Fallback: technologies spotted locally in the candidate's own replies
+        fallback = list(self._tech_mentions) or ["Python", "SQL"]
+        match = TECH_STACK_RE.search(transition_message)
+        if not match:
+            return fallback
+        items = re.split(r",|\band\b", match.group(1).replace("*", "").strip("[] "))
+        return [t.strip() for t in items if t.strip()] or fallback
+
+    def _fetch_assessment(self, tech_stack: List[str]) -> Optional[Dict]:
+        """Returns questions grouped by technology, generating uncached ones in parallel."""
+        from langchain_core.messages import HumanMessage
+
+        assessment: Dict[str, List[TechQuestion]] = {}
+        pending: Dict[str, str] = {}
+        seen = set()
+        for tech in tech_stack:
+            # Skip repeats (e.g. 'Postgres' and 'PostgreSQL') whether or not they are cached
+            name = canonical_tech(tech)
+            if not name or name in seen:
+                continue
+            seen.add(name)
+            cached = _ASSESSMENT_CACHE.get(name)
+            if cached is not None:
+                assessment[tech.strip()] = cached
+            else:
+                pending[name] = tech.strip()
+
+        if pending:
+            # One small prompt per technology, sent concurrently: latency ~ max, not sum
+            prompts = [
+                [HumanMessage(content=self.tech_prompt.format(technology=tech))]
+                for tech in pending.values()
+            ]
+            results = self.structured_llm.batch(
+                prompts,
+                config={"max_concurrency": MAX_CONCURRENT_LLM_REQUESTS},
+                return_exceptions=True,
+            )
+
+            for (name, tech), result in zip(pending.items(), results):
+                if not isinstance(result, TechAssessment) or not result.questions:
+                    continue
+                _ASSESSMENT_CACHE[name] = result.questions
+                assessment[tech] = result.questions
+
+        return assessment or None
+
+    def _prefetch_assessment(self, tech_stack: List[str]) -> None:
+        """Starts question generation in the background for a stack awaiting confirmation."""
+        key = tech_stack_key(tech_stack)
+
+        # A restated stack supersedes earlier speculation; drop work that has not started yet
+        for stale_key in [k for k in self._prefetched if k != key]:
+            self._prefetched.pop(stale_key).cancel()
+
+        if key not in self._prefetched:
+            self._prefetched[key] = self._executor.submit(self._fetch_assessment, tech_stack)
 
     def _generate_technical_questions(self, tech_stack: List[str]) -> Dict:
-        """Generates structured technical questions using PydanticOutputParser."""
-        tech_stack_str = ", ".join(tech_stack)
-        prompt_value = self.tech_prompt.format_prompt(tech_stack=tech_stack_str)
-        response = self.llm.invoke(prompt_value.to_messages())
-        
-        try:
-            parsed_output = self.assessment_parser.parse(response.content)
-            self.tech_questions = parsed_output.assessment
-            for questions in self.tech_questions.values():
-                self.all_questions_list.extend([q.question for q in questions])
-            return self.tech_questions
-        except Exception:
+        """Generates structured technical questions, reusing a prefetched result when available."""
+        future = self._prefetched.pop(tech_stack_key(tech_stack), None)
+        assessment = future.result() if future else self._fetch_assessment(tech_stack)
+        if assessment is None:
             return None
 
-    def _get_next_question(self) -> str:
-        """Retrieves the next question from the flattened list."""
-        if self.current_question_index < len(self.all_questions_list):
-            question = self.all_questions_list[self.current_question_index]
-            self.current_question_index += 1
-            return question
-        else:
-            return None
+        self.tech_questions = assessment
+        all_qs = [q.question for questions in self.tech_questions.values() for q in questions]
+        self._questions = tuple(enumerate(all_qs, start=1))
+        self._q_iter = iter(self._questions)
+        return self.tech_questions
+
+    def _get_next_question(self) -> Tuple[Optional[int], Optional[str]]:
+        """Retrieves the next (number, question) pair, or (None, None) when exhausted."""
+        return next(self._q_iter, (None, None))
             
-    def _end_conversation(self, final_state: str) -> str:
+    def _end_conversation(self, final_state: State) -> str:
         """Gracefully concludes the conversation."""
         return (
             "Thank you for completing the initial screening with TalentScout Hiring Assistant. "
             "Your information has been securely recorded. Goodbye and good luck!"
         )
 
-    def process_user_input(self, user_input: str, current_state: str) -> tuple[str, str]:
-        """Main function to process user input and manage the state machine."""
+    def process_user_input(self, user_input: str, current_state: State) -> tuple[Union[str, Iterator[str]], State]:
+        """Main function to process user input and manage the state machine.
+
+        LLM-generated replies are returned as a token stream; canned replies as plain strings.
+        """
         
         if user_input.lower() in ["quit", "bye", "exit", "end"]:
             return self._end_conversation(State.END), State.END
 
-        if current_state == State.GREETING:
-            response = self.info_chain.run(user_input=user_input)
-            return response, State.GATHER_INFO
+        if current_state is State.GREETING:
+            return self._stream_info_response(user_input), State.GATHER_INFO
 
-        elif current_state == State.GATHER_INFO:
+        elif current_state is State.GATHER_INFO:
             
             # Check for transition command *only after* the LLM has presented the transition phrase
-            history_str = self.memory.load_memory_variables({})['history'][-1].content.lower() if self.memory.load_memory_variables({})['history'] else ""
-            
-            if "next" in user_input.lower() and "technical assessment stage" in history_str:
+            if self._transition_armed and NEXT_COMMAND_RE.fullmatch(user_input):
                 
-                tech_stack = self._extract_tech_stack_from_history()
+                # The stack was recorded when the transition message streamed; no history replay needed
+                tech_stack = self.candidate_info.get("tech_stack") or self._parse_tech_stack(self.history[-1][1])
                 self._generate_technical_questions(tech_stack)
                 
-                if self.all_questions_list:
-                    first_question = self._get_next_question()
-                    return f"Excellent. We have {len(self.all_questions_list)} questions. **Question 1:** {first_question}", State.ASK_QUESTIONS
+                if self._questions:
+                    q_num, first_question = self._get_next_question()
+                    return f"Excellent. We have {len(self._questions)} questions. **Question {q_num}:** {first_question}", State.ASK_QUESTIONS
                 else:
                     return "I apologize, question generation failed. Ending conversation.", State.END
 
-            # Continue gathering (run the conversational chain)
-            response = self.info_chain.run(user_input=user_input)
-            return response, State.GATHER_INFO
+            # Continue gathering (stream the conversational reply)
+            return self._stream_info_response(user_input), State.GATHER_INFO
 
-        elif current_state == State.ASK_QUESTIONS:
-            self.user_answers[f"Q{self.current_question_index}"] = user_input
-            next_question = self._get_next_question()
+        elif current_state is State.ASK_QUESTIONS:
+            self.user_answers.append(user_input)
+            q_num, next_question = self._get_next_question()
             
             if next_question:
-                q_num = self.current_question_index + 1
                 return f"Thank you for your answer. \n\n**Question {q_num}:** {next_question}", State.ASK_QUESTIONS
             else:
                 return self._end_conversation(State.END), State.END
@@ -1,48 +1,48 @@
 import streamlit as st
+import itertools
 import os
 import sys
 import time
 
 # Correctly import constants from the config module
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config.settings import GEMINI_API_KEY, State
+from config.settings import GEMINI_API_KEY, SessionKey, State
 
 # Correctly import the TalentScoutAssistant class from the app module
-from app.chat_logic import TalentScoutAssistant
+from app.chat_logic import AssistantResources, TalentScoutAssistant
 
 
 # --- Configuration and Initialization ---
 
-# Define the conversational states used in the project
-# Ensure these match the States defined in your TalentScoutAssistant's process_user_input
-State.GREETING = "GREETING"
-State.GATHER_INFO = "GATHER_INFO"
-State.ASK_QUESTIONS = "ASK_QUESTIONS"
-State.END = "END"
+
+@st.cache_resource
+def get_shared_resources() -> AssistantResources:
+    """Creates the LLM client and prompts once per process and shares them across sessions."""
+    return AssistantResources()
 
 
 def initialize_session_state():
     """Sets up the initial Streamlit session state."""
     
     # 1. Initialize the Assistant Object
-    if State.LOGIC_AGENT not in st.session_state:
+    if SessionKey.LOGIC_AGENT not in st.session_state:
         try:
-            # Initialize the LangChain object only once
-            st.session_state[State.LOGIC_AGENT] = TalentScoutAssistant()
+            # Initialize the per-session assistant on top of the shared LangChain objects
+            st.session_state[SessionKey.LOGIC_AGENT] = TalentScoutAssistant(get_shared_resources())
         except ValueError:
             # Handle the case where the API key is not set
-            st.session_state[State.LOGIC_AGENT] = None
+            st.session_state[SessionKey.LOGIC_AGENT] = None
     
     # 2. Initialize the Conversation History
-    if State.MESSAGES not in st.session_state:
-        st.session_state[State.MESSAGES] = []
+    if SessionKey.MESSAGES not in st.session_state:
+        st.session_state[SessionKey.MESSAGES] = []
         
     # 3. Initialize the State Machine
     if 'current_state' not in st.session_state:
         st.session_state['current_state'] = State.GREETING
         
         # Add the first message (greeting)
-        st.session_state[State.MESSAGES].append(
+        st.session_state[SessionKey.MESSAGES].append(
             {"role": "assistant", "content": "Hello! I am **TalentScout Hiring Assistant**. I'll guide you through our initial screening. Please provide your **Full Name** to begin."}
         )
 
@@ -66,25 +66,25 @@ def main():
 
     # Initialize the required state variables
     initialize_session_state()
-    agent = st.session_state[State.LOGIC_AGENT]
+    agent = st.session_state[SessionKey.LOGIC_AGENT]
     
     if agent is None: # Second check for failed initialization
         st.error("❌ **ERROR**: Failed to initialize the Assistant. Check configuration or API key.")
         return
 
     # --- Display Conversation ---
-    for message in st.session_state[State.MESSAGES]:
+    for message in st.session_state[SessionKey.MESSAGES]:
         with st.chat_message(message["role"]):
             st.markdown(message["content"])
 
     # --- User Input Handling ---
-    if st.session_state['current_state'] != State.END:
+    if st.session_state['current_state'] is not State.END:
         
         # Enable input if the conversation is ongoing
         if prompt := st.chat_input("Enter your information or response...", disabled=False):
             
             # 1. Add user message to state and display
-            st.session_state[State.MESSAGES].append({"role": "user", "content": prompt})
+            st.session_state[SessionKey.MESSAGES].append({"role": "user", "content": prompt})
             with st.chat_message("user"):
                 st.markdown(prompt)
 
@@ -93,20 +93,31 @@ def main():
                 with st.spinner("Processing response..."):
                     
                     # Call the main backend function to process the input and determine the next state
-                    ai_response_text, new_state = agent.process_user_input(
+                    ai_response, new_state = agent.process_user_input(
                         user_input=prompt,
                         current_state=st.session_state['current_state']
                     )
-                    
-                    # Update state and display response
-                    st.session_state['current_state'] = new_state
-                    st.session_state[State.MESSAGES].append(
-                        {"role": "assistant", "content": ai_response_text}
-                    )
-                    st.markdown(ai_response_text)
-                    
-            # Rerun to update the input field state 
-            st.rerun() 
+
+                    # Streamed replies are lazy: keep the spinner up until the first token arrives
+                    if not isinstance(ai_response, str):
+                        first_chunk = next(ai_response, "")
+
+                # Render LLM replies token by token; canned replies are plain strings
+                if isinstance(ai_response, str):
+                    st.markdown(ai_response)
+                    ai_response_text = ai_response
+                else:
+                    ai_response_text = st.write_stream(itertools.chain([first_chunk], ai_response))
+
+                # Update state and record the full response
+                st.session_state['current_state'] = new_state
+                st.session_state[SessionKey.MESSAGES].append(
+                    {"role": "assistant", "content": ai_response_text}
+                )
+
+            # st.chat_input already triggers the next run; rerun only on END so the input is removed
+            if new_state is State.END:
+                st.rerun()
             
     else:
         st.info("✅ This conversation has concluded. Thank you for your time!")
@@ -1,4 +1,5 @@
 import os
+from enum import Enum
 from dotenv import load_dotenv
 
 # Load environment variables from a local .env file (standard for VS Code/local)
@@ -7,12 +8,23 @@ load_dotenv()
 # Configuration constants
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY") 
 GEMINI_MODEL_NAME = "gemini-2.5-flash-lite" # Fast conversational model
+LLM_CACHE_PATH = ".langchain_cache.db" # SQLite file backing the LangChain LLM cache
+HISTORY_WINDOW_TURNS = 3 # Full candidate/assistant exchanges kept in the prompt history
+LLM_TIMEOUT_SECONDS = 20 # Per-request timeout for Gemini calls
+LLM_MAX_ATTEMPTS = 3 # Attempts per Gemini call on transient (429/503/timeout) errors
+LLM_RETRY_MIN_WAIT_SECONDS = 0.5 # Lower bound of the jittered backoff between attempts
+LLM_RETRY_MAX_WAIT_SECONDS = 4 # Upper bound of the jittered backoff between attempts
+MAX_CONCURRENT_LLM_REQUESTS = 8 # Upper bound on parallel Gemini calls per batch
+PREFETCH_WORKERS = 4 # Background threads for speculative question generation
 
-# Conversation state flags for the State Machine
-class State:
+# Conversation state flags for the State Machine (singletons, so dispatch can use `is`)
+class State(str, Enum):
     GREETING = "greeting"
     GATHER_INFO = "gather_info"
     ASK_QUESTIONS = "ask_questions"
     END = "end"
+
+# Streamlit session_state keys
+class SessionKey:
     LOGIC_AGENT = "logic_agent"
     MESSAGES = "messages"